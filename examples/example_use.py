@@ -23,44 +23,17 @@ The example considers following scenario:
 3. Automatically controls the 'Pump_ON' command and 'Release_valve' position.
 """
 
-import json
 import time
-from multiprocessing.shared_memory import SharedMemory
 from snap7_db_sync import Snap7DBSync
 
 
-def read_single_variable(variable_key, shared_mem, shared_mem_size):
-    """Retrieves a single value from the shared memory JSON buffer."""
-    raw = bytes(shared_mem.buf[:shared_mem_size]).rstrip(b"\x00")
-    if raw:
-        data = json.loads(raw)
-        return data.get(variable_key)
-    return None
-
-
-def read_multiple_variables(variable_keys, shared_mem, shared_mem_size):
-    """Retrieves a subset of variables from shared memory as a dictionary."""
-    raw = bytes(shared_mem.buf[:shared_mem_size]).rstrip(b"\x00")
-    if raw:
-        data = json.loads(raw)
-        if isinstance(variable_keys, list):
-            return {key: data[key] for key in variable_keys if key in data}
-    return None
-
-
-def read_all_variables(shared_mem, shared_mem_size):
-    """Returns the entire PLC Data Block image as a dictionary."""
-    raw = bytes(shared_mem.buf[:shared_mem_size]).rstrip(b"\x00")
-    return json.loads(raw) if raw else None
-
-
 # --- Configuration ---
 PLC_IP = "192.168.0.100"
 DB_NUMBER = 100
 BLUEPRINT_FILE = "demo_db_blueprint1.txt" # Right click on DB copy as text -> .txt
 BLUEPRINT_FILE2 = "demo_db_blueprint2.txt" # Inside the DB select all -> txt
 SHM_NAME = "shared_plc_data"
-SHM_SIZE = 2048  # Must match the size defined in Snap7DBSync
+SHM_SIZE = 2048  # Grown automatically if the DB frame does not fit
 CYCLE_TIME_MS = 20
 
 # 1. Initialize the Sync Engine
@@ -80,11 +53,9 @@ if connection:
     plc_comm.start_logging(cycle_time_ms=CYCLE_TIME_MS)
     time.sleep(0.1)
 
-    # 3. Access the Shared Memory segment created by the library
-    shared_mem = SharedMemory(name=SHM_NAME, create=False)
-
-    # Initial System Check: Ensure the plant is powered on
-    power_state = read_single_variable("Power", shared_mem, SHM_SIZE)
+    # 3. Initial System Check: Ensure the plant is powered on
+    # Variables are decoded straight from the binary Shared Memory frame, one field at a time
+    power_state = plc_comm.read_variable("Power")
     if power_state is not True:
         print("System Power is OFF. Sending Power_ON command...")
         plc_comm.write_to_plc({"Power_ON": True})
@@ -95,8 +66,7 @@ if connection:
     try:
         while True:
             # 4. Read process variables
-            plant_state = read_multiple_variables(["Tank_level", "Pump_On"], shared_mem=shared_mem,
-                                                  shared_mem_size=SHM_SIZE)
+            plant_state = plc_comm.read_variables(["Tank_level", "Pump_On"])
 
             # 5. Process Control Logic
             if plant_state["Tank_level"] < 50 and not plant_state["Pump_On"]:
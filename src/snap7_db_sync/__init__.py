@@ -1,4 +1,5 @@
-from .sync_engine import Snap7DBSync
+from .sync_engine import Snap7DBSync, MultiDBReader, attach_reader
+from .shm_reader import SHMReader
 
 __version__ = "0.1.1"
-__all__ = ["Snap7DBSync"]
\ No newline at end of file
+__all__ = ["Snap7DBSync", "MultiDBReader", "SHMReader", "attach_reader"]
@@ -0,0 +1,486 @@
+import os
+import sys
+import time
+import struct
+import threading
+import multiprocessing.shared_memory as shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # optional, enables the vectorized bulk decode in read_all_variables
+    np = None
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:  # optional, C serializer for read_all_json
+    import json
+    import math
+    def _json_dumps(values):
+        """
+        Compact UTF-8 JSON of the variable values. NaN and Infinity REALs become null, as with orjson,
+        since JSON has no literal for them.
+
+        :param values: dict: Variable values by name.
+        :return: bytes: JSON document.
+        """
+        try:
+            return json.dumps(values, separators=(',', ':'), allow_nan=False).encode('utf-8')
+        except ValueError:
+            values = {key: None if isinstance(value, float) and not math.isfinite(value) else value
+                      for key, value in values.items()}
+            return json.dumps(values, separators=(',', ':'), allow_nan=False).encode('utf-8')
+
+# Shared memory frame header: [sequence: uint64][payload length: uint64] padded to its own 64 byte cache line.
+# Two slots holding the raw DB image follow the header (double buffer), each starting on a cache line,
+# so every variable lives at _FRAME_PAYLOAD + slot index * slot stride + its DB offset.
+# The sequence works as a seqlock: odd while the writer is copying, even once a frame is published.
+# The published frame of an even sequence is in slot (seq >> 1) & 1, the writer always fills the other slot.
+_FRAME_HEADER = struct.Struct('<QQ')
+_FRAME_PAYLOAD = 64
+
+
+def _slot_stride(total_len: int) -> int:
+    """
+    Returns the distance between the two frame slots: the DB length rounded up to a whole cache line.
+
+    :param total_len: int: Total byte length of the DB.
+    :return: int: Slot stride in bytes.
+    """
+    return (total_len + 63) // 64 * 64
+
+
+def _slot_offset(seq: int, stride: int) -> int:
+    """
+    Returns the offset of the slot holding the frame published with an even sequence.
+
+    :param seq: int: Even sequence of the published frame.
+    :param stride: int: Slot stride in bytes.
+    :return: int: Offset of the DB image in the segment.
+    """
+    return _FRAME_PAYLOAD + ((seq >> 1) & 1) * stride
+
+# Map S7 types to precompiled Struct objects (Big-Endian '>' is required for PLC), shared by every decode
+# >h = Short (Int), >H = Unsigned Short (Word)
+# >i = Long (DInt), >I = Unsigned Long (DWord)
+# >f = Float (Real), B = the whole byte holding a Bool
+_STRUCTS = {
+    'bool': struct.Struct('B'), 'byte': struct.Struct('B'),
+    'int': struct.Struct('>h'), 'word': struct.Struct('>H'),
+    'dint': struct.Struct('>i'), 'dword': struct.Struct('>I'),
+    'real': struct.Struct('>f'), 'time': struct.Struct('>i')
+}
+
+# Big-endian NumPy formats for the structured dtype used by the bulk decode (bools are handled with bit masks)
+_NP_FORMATS = {
+    'byte': 'u1',
+    'int': '>i2', 'word': '>u2',
+    'dint': '>i4', 'dword': '>u4',
+    'real': '>f4', 'time': '>i4'
+}
+
+# From this many bools on, the NumPy decode extracts them with one gather/mask over the DB image;
+# below it the per-bool byte/mask test inlined in the decoder is cheaper than the NumPy call overhead
+_VECTOR_BOOLS_MIN = 64
+
+# Serializes the temporary resource tracker hook of _attach_untracked
+_ATTACH_LOCK = threading.Lock()
+
+def _attach_untracked(shm_name: str) -> shared_memory.SharedMemory:
+    """
+    Opens an existing Shared Memory segment without handing it to this process' resource tracker.
+    Otherwise the tracker of a reader process would unlink the writer's segment when the reader exits.
+
+    :param shm_name: str: Name of the Shared memory segment.
+    :return: SharedMemory: Handle of the existing segment.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=shm_name, track=False)
+    if os.name != 'posix':
+        return shared_memory.SharedMemory(name=shm_name)  # Windows segments are not tracked
+
+    # Before 3.13 every attach registers the segment. Unregistering it afterwards would also drop the writer's
+    # registration whenever the tracker is shared with it (same process, or a multiprocessing child), so the
+    # registration of this segment is skipped instead, just like track=False does.
+    from multiprocessing import resource_tracker
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+        def register_others(name, rtype):
+            if rtype != 'shared_memory' or name.lstrip('/') != shm_name.lstrip('/'):
+                register(name, rtype)
+        resource_tracker.register = register_others
+        try:
+            return shared_memory.SharedMemory(name=shm_name)
+        finally:
+            resource_tracker.register = register
+
+class SHMReader:
+    """
+    Reader side of the Shared Memory frame flashed by Snap7DBSync.
+
+    Decodes variables straight from the binary frame using the memory map of the DB blueprint.
+    Usable in the process running Snap7DBSync as well as in any other process attached to the same segment
+    (see attach_reader). Reads are lock-free: the frame is double buffered and the seqlock header is used to
+    detect and retry the rare frame overwritten while it was being decoded.
+    """
+    def __init__(self, data_struct: dict, total_len: int, round_reals: int | None = None):
+        """
+        Builds the decode tables from the memory map of the DB.
+
+        :param data_struct: dict: Dictionary of DB structure extracted from the db_blueprint_txt file.
+        :param total_len: int: Total byte length of the DB.
+        :param round_reals: int | None: Decimal places Real values are rounded to when decoded, None to return them
+            unrounded (float32 precision, e.g. 1.100000023841858). Records are never rounded. (Default: None)
+        """
+        self.data_struct = data_struct
+        self.total_len = total_len
+        self.round_reals = round_reals
+        self._stride = _slot_stride(total_len)
+        self.shm = None
+        self._mv = None
+        self._decoded = (0, None)
+        self._encoded = (0, None)
+
+        # Per variable (offset, bit, Struct) used to decode a single field from the frame
+        self._field_codecs = {
+            name: (
+                meta['offset'],
+                meta['bit'] if meta['type'] == 'bool' else None,
+                _STRUCTS[meta['type']]
+            )
+            for name, meta in data_struct.items()
+        }
+
+        # Single Struct decoding every non bool variable in one call, gaps between variables skipped as pad bytes
+        self._scalar_names = sorted(
+            (name for name, meta in data_struct.items() if meta['type'] != 'bool'),
+            key=lambda name: data_struct[name]['offset']
+        )
+        fmt, end = '>', 0
+        for name in self._scalar_names:
+            offset = data_struct[name]['offset']
+            if offset > end:
+                fmt += f'{offset - end}x'
+            fmt += _STRUCTS[data_struct[name]['type']].format.lstrip('>')
+            end = offset + data_struct[name]['size']
+        self._codec = struct.Struct(fmt)
+        self._bool_masks = [
+            (name, meta['offset'], 1 << meta['bit'])
+            for name, meta in data_struct.items() if meta['type'] == 'bool'
+        ]
+
+        # Structured dtype viewing the whole DB image at once, every non bool variable at its absolute offset
+        self._np_dtype = None
+        if np is not None and data_struct:
+            self._np_dtype = np.dtype({
+                'names': self._scalar_names,
+                'formats': [_NP_FORMATS[data_struct[name]['type']] for name in self._scalar_names],
+                'offsets': [data_struct[name]['offset'] for name in self._scalar_names],
+                'itemsize': total_len
+            })
+
+        self._decoder = self._build_decoder()
+
+    # internal helper methods
+    def _build_decoder(self):
+        """
+        Generates the bulk decode function specialized to this DB.
+        All numeric variables come from one C-level call (structured dtype view with NumPy, whole-record Struct
+        otherwise); the function then builds the result as a single dict literal with every variable inlined in
+        blueprint order, bools as a byte/mask test (one vectorized gather for bool heavy DBs with NumPy).
+        No per-variable metadata lookup or type dispatch remains.
+
+        :return: Callable[[bytes | memoryview, int], dict]: Decoder taking the buffer and the DB image offset.
+        """
+        if self._np_dtype is None:
+            scalars = self._codec.unpack_from
+        else:
+            # item() converts the whole record to Python scalars in one call, in the dtype's field order
+            dtype = self._np_dtype
+            def scalars(data_byte, base):
+                return np.frombuffer(data_byte, dtype=dtype, count=1, offset=base)[0].item()
+
+        index = {name: i for i, name in enumerate(self._scalar_names)}
+        masks = {name: (offset, mask) for name, offset, mask in self._bool_masks}
+        namespace = {'scalars': scalars}
+        body = '    v = scalars(b, base)\n'
+
+        # Bool heavy DBs: every bool from one C-level gather of the holding bytes and mask test
+        vector_bools = self._np_dtype is not None and len(self._bool_masks) >= _VECTOR_BOOLS_MIN
+        if vector_bools:
+            bool_index = {name: i for i, (name, _, _) in enumerate(self._bool_masks)}
+            bool_bytes = np.array([offset for _, offset, _ in self._bool_masks], dtype=np.intp)
+            bool_masks = np.array([mask for _, _, mask in self._bool_masks], dtype=np.uint8)
+            total_len = self.total_len
+            def bools(data_byte, base):
+                image = np.frombuffer(data_byte, dtype=np.uint8, count=total_len, offset=base)
+                return ((image[bool_bytes] & bool_masks) != 0).tolist()
+            namespace['bools'] = bools
+            body += '    w = bools(b, base)\n'
+
+        # Optional rounding of Reals: with NumPy all of them are gathered, widened and rounded in one call,
+        # otherwise each one goes through round() in the generated code
+        digits = self.round_reals
+        reals = [name for name in self._scalar_names if self.data_struct[name]['type'] == 'real']
+        vector_reals = digits is not None and reals and self._np_dtype is not None
+        if vector_reals:
+            real_index = {name: i for i, name in enumerate(reals)}
+            real_bytes = np.array(
+                [[self.data_struct[name]['offset'] + i for i in range(4)] for name in reals], dtype=np.intp
+            )
+            total_len = self.total_len
+            def rounded_reals(data_byte, base):
+                image = np.frombuffer(data_byte, dtype=np.uint8, count=total_len, offset=base)
+                return np.round(image[real_bytes].view('>f4')[:, 0].astype(np.float64), digits).tolist()
+            namespace['rounded_reals'] = rounded_reals
+            body += '    r = rounded_reals(b, base)\n'
+
+        entries = []
+        for name in self.data_struct:
+            if name in masks:
+                if vector_bools:
+                    entries.append(f'{name!r}: w[{bool_index[name]}]')
+                else:
+                    entries.append(f'{name!r}: (b[base + {masks[name][0]}] & {masks[name][1]}) != 0')
+            elif vector_reals and name in real_index:
+                entries.append(f'{name!r}: r[{real_index[name]}]')
+            elif digits is not None and name in reals:
+                entries.append(f'{name!r}: round(v[{index[name]}], {int(digits)})')
+            else:
+                entries.append(f'{name!r}: v[{index[name]}]')
+        source = 'def decode(b, base):\n' + body + '    return {' + ', '.join(entries) + '}\n'
+        exec(source, namespace)
+        return namespace['decode']
+
+
+    def _read_frame(self, decode) -> tuple | None:
+        """
+        Decodes the published Shared Memory frame in place, without copying the payload out of the segment.
+        The writer only fills the other slot, so the decode is valid unless the writer has meanwhile started
+        to refill this slot, two publications later; only then the sequence re-check makes it retry.
+
+        :param decode: Callable[[memoryview, int], Any]: Decoder called with the segment buffer and the slot offset.
+        :return: tuple | None: (sequence, decoded result), None if no frame has been written yet.
+        """
+        mv = self._mv
+        while True:
+            # While the writer is busy (odd) the last published frame is the previous even sequence
+            seq = _FRAME_HEADER.unpack_from(mv, 0)[0] & ~1
+            if seq == 0:
+                return None
+            result = decode(mv, _slot_offset(seq, self._stride))
+            if _FRAME_HEADER.unpack_from(mv, 0)[0] <= seq + 2:
+                return seq, result
+            time.sleep(0)
+
+    def _unpack_field(self, data_byte, name, base: int = 0):
+        """
+        Decodes a single variable from a raw DB image.
+
+        :param data_byte: bytes | memoryview: Buffer holding the raw DB data.
+        :param name: str: Variable name from the db_blueprint_txt file.
+        :param base: int: Offset of the DB image inside data_byte. (Default: 0)
+        :return: The decoded value of the variable.
+        """
+        offset, bit, codec = self._field_codecs[name]
+        value = codec.unpack_from(data_byte, base + offset)[0]
+        if bit is not None:
+            return bool((value >> bit) & 1)
+        if self.round_reals is not None and codec is _STRUCTS['real']:
+            return round(value, self.round_reals)
+        return value
+
+    def _decode_all(self, data_byte, base: int = 0) -> dict:
+        """
+        Decodes every variable from a raw DB image through the generated decoder.
+        All numeric variables are byte-swapped in C in one call: through the structured dtype view when NumPy is
+        available, otherwise through the precompiled whole-record Struct.
+
+        :param data_byte: bytes | memoryview: Buffer holding the raw DB data.
+        :param base: int: Offset of the DB image inside data_byte. (Default: 0)
+        :return: dict: { "variable_name": value } for every variable.
+        """
+        return self._decoder(data_byte, base)
+
+    def _cached_values(self) -> dict | None:
+        """
+        Returns the decoded DB image of the current frame.
+        The image is cached with its frame sequence and only decoded again once the writer publishes a new frame.
+
+        :return: dict | None: Cached { "variable_name": value }, None if not attached or no frame written yet.
+        """
+        if self._mv is None:
+            return None
+        decoded_seq, values = self._decoded
+        seq = _FRAME_HEADER.unpack_from(self._mv, 0)[0] & ~1
+        if seq == 0:
+            return None
+        if seq != decoded_seq:
+            frame = self._read_frame(self._decode_all)
+            if frame is None:
+                return None
+            self._decoded = frame
+            values = frame[1]
+        return values
+
+    # public methods
+    def attach(self, shm: shared_memory.SharedMemory) -> None:
+        """
+        Attaches the reader to a Shared Memory segment holding the frame.
+
+        :param shm: SharedMemory: Segment written by Snap7DBSync.
+        """
+        self.detach()
+        self.shm = shm
+        self._mv = shm.buf.cast('B')
+
+    def detach(self) -> None:
+        """
+        Releases the view of the Shared Memory segment. The segment itself is left open.
+        """
+        if self._mv is not None:
+            try:
+                self._mv.release()
+            except BufferError:
+                pass  # a decode still holds the view, it is dropped with it
+            self._mv = None
+        self.shm = None
+        self._decoded = (0, None)
+        self._encoded = (0, None)
+
+    def close(self) -> None:
+        """
+        Detaches and closes the Shared Memory handle of this process. The segment is not unlinked.
+        """
+        shm = self.shm
+        self.detach()
+        if shm is not None:
+            shm.close()
+
+    def read_variable(self, name: str):
+        """
+        Reads a single variable from the Shared Memory frame.
+        Only the bytes of the requested variable are decoded, directly from the segment.
+
+        :param name: str: Variable name from the db_blueprint_txt file.
+        :return: The value of the variable, None if unknown or no frame has been written yet.
+        """
+        if self._mv is None or name not in self._field_codecs:
+            return None
+        frame = self._read_frame(lambda mv, base: self._unpack_field(mv, name, base))
+        return None if frame is None else frame[1]
+
+    def read_variables(self, names) -> dict | None:
+        """
+        Reads a subset of variables from the Shared Memory frame, directly from the segment.
+
+        :param names: list: Variable names from the db_blueprint_txt file. Unknown names are skipped.
+        :return: dict | None: { "variable_name": value }, None if no frame has been written yet.
+        """
+        if self._mv is None:
+            return None
+        names = [name for name in names if name in self._field_codecs]
+        frame = self._read_frame(lambda mv, base: {name: self._unpack_field(mv, name, base) for name in names})
+        return None if frame is None else frame[1]
+
+    def read_all_variables(self) -> dict | None:
+        """
+        Reads the entire PLC Data Block image from the Shared Memory frame.
+        While the writer has not published a new frame, the cached image is returned without decoding again.
+
+        :return: dict | None: { "variable_name": value } for every variable, None if no frame has been written yet.
+        """
+        values = self._cached_values()
+        return None if values is None else dict(values)
+
+    def read_all_json(self) -> bytes | None:
+        """
+        Reads the entire PLC Data Block image as a compact UTF-8 JSON document, for consumers of the former JSON
+        shared memory format. Uses orjson when installed. NaN and Infinity REALs are encoded as null.
+        The document is encoded once per published frame and reused until the writer publishes a new one.
+
+        :return: bytes | None: JSON object of every variable, None if no frame has been written yet.
+        """
+        values = self._cached_values()
+        if values is None:
+            return None
+        seq = self._decoded[0]
+        if self._encoded[0] != seq:
+            self._encoded = (seq, _json_dumps(values))
+        return self._encoded[1]
+
+    def get(self, name: str):
+        """
+        Returns a single variable from the cached decode of the current frame.
+        Cheaper than read_variable when a control loop queries several variables or groups per iteration,
+        since the frame is decoded at most once per published sequence.
+
+        :param name: str: Variable name from the db_blueprint_txt file.
+        :return: The value of the variable, None if unknown or no frame has been written yet.
+        """
+        values = self._cached_values()
+        return None if values is None else values.get(name)
+
+    def get_many(self, names) -> dict | None:
+        """
+        Returns a subset of variables from the cached decode of the current frame.
+
+        :param names: list: Variable names from the db_blueprint_txt file. Unknown names are skipped.
+        :return: dict | None: { "variable_name": value }, None if no frame has been written yet.
+        """
+        values = self._cached_values()
+        if values is None:
+            return None
+        return {name: values[name] for name in names if name in values}
+
+    def read_record(self, out=None):
+        """
+        Reads the entire PLC Data Block image as a NumPy structured record (every non bool variable as a field).
+        The record is a consistent copy of the frame taken under the seqlock, for vectorized consumers.
+        Passing a preallocated record as out (from new_record or a previous call) makes cyclic consumers decode
+        without any allocation.
+        Requires NumPy.
+
+        :param out: numpy.ndarray | None: Array of one record with this reader's dtype to copy into. (Default: None)
+        :return: numpy.ndarray | None: Array of one record (out if given), None if not attached or no frame written yet.
+        """
+        if self._np_dtype is None:
+            raise ImportError("NumPy is required for read_record")
+        if self._mv is None:
+            return None
+        if out is None:
+            out = np.empty(1, dtype=self._np_dtype)
+        frame = self._read_frame(
+            lambda mv, base: np.copyto(out, np.frombuffer(mv, dtype=self._np_dtype, count=1, offset=base))
+        )
+        return None if frame is None else out
+
+    def new_record(self):
+        """
+        Allocates an empty record with this reader's dtype, to be reused as the out buffer of read_record.
+        Requires NumPy.
+
+        :return: numpy.ndarray: Zeroed array of one record.
+        """
+        if self._np_dtype is None:
+            raise ImportError("NumPy is required for new_record")
+        return np.zeros(1, dtype=self._np_dtype)
+
+    def view_record(self):
+        """
+        Returns a zero-copy NumPy structured view of the DB image inside the Shared Memory segment.
+        The view covers the slot published at call time and is not protected by the seqlock: it stays current until
+        the next PLC update, after which the slot is refilled by the writer two updates later.
+        Use read_record for a consistent snapshot. Delete the view before closing the reader.
+        Requires NumPy.
+
+        :return: numpy.ndarray | None: Array of one record, None if not attached or no frame has been written yet.
+        """
+        if self._np_dtype is None:
+            raise ImportError("NumPy is required for view_record")
+        if self.shm is None:
+            return None
+        seq = _FRAME_HEADER.unpack_from(self.shm.buf, 0)[0] & ~1
+        if seq == 0:
+            return None
+        return np.frombuffer(self.shm.buf, dtype=self._np_dtype, count=1, offset=_slot_offset(seq, self._stride))
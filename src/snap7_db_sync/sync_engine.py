@@ -1,10 +1,172 @@
 import snap7
-import json
+import ctypes
+import sys
 import time
 import struct
 import threading
+import queue
+import multiprocessing
 import multiprocessing.shared_memory as shared_memory
 import re
+from types import MappingProxyType
+
+from .shm_reader import SHMReader, _FRAME_HEADER, _FRAME_PAYLOAD, _STRUCTS, _attach_untracked, _slot_offset, _slot_stride
+
+# S7 type -> (size in bytes, alignment in bytes) for Standard (Non-Optimized) Data Blocks
+_S7_TYPES = MappingProxyType({
+    'bool': (1, 0), 'byte': (1, 1), 'word': (2, 2), 'int': (2, 2),
+    'dword': (4, 2), 'dint': (4, 2), 'real': (4, 2), 'time': (4, 2)
+})
+
+# Blueprint patterns, compiled once at import
+# SCL export: content between STRUCT and END_STRUCT, ignoring headers/footers
+_STRUCT_RE = re.compile(r'STRUCT(.*?)END_STRUCT', re.DOTALL | re.IGNORECASE)
+# SCL export: 'Name : Type;'
+_SCL_FIELD_RE = re.compile(r'^[ \t]*([a-zA-Z0-9_]+)\s*:\s*([a-zA-Z]+)\s*;', re.MULTILINE)
+# TIA table-copy: 'Name Type Offset.Bit', ignores shifting tabs and trailing comments automatically
+_TABLE_FIELD_RE = re.compile(r'^[ \t]*([a-zA-Z0-9_]+)[\s]+([a-zA-Z]+)[\s]+(\d+)\.(\d+)', re.MULTILINE)
+
+# S7 area / word length codes of the snap7 C API and the item limit of one ReadMultiVars request
+_S7_AREA_DB = 0x84
+_S7_WL_BYTE = 0x02
+_S7_MAX_VARS = 20
+
+# Largest gap (bytes) between two written variables still sent within one db_write
+_WRITE_MERGE_GAP = 16
+
+# Cycles a queued write is retried after a temporary error before it is dropped
+_WRITE_RETRIES = 3
+
+# snap7 error texts of failures that may pass on their own (connection lost, PLC busy)
+_TRANSIENT_ERRORS = ("TCP :", "ISO :", "Job pending", "Job Timeout")
+
+class _S7DataItem(ctypes.Structure):
+    """
+    TS7DataItem of the snap7 C API: one area read of a ReadMultiVars request.
+    """
+    _fields_ = [
+        ('Area', ctypes.c_int32), ('WordLen', ctypes.c_int32), ('Result', ctypes.c_int32),
+        ('DBNumber', ctypes.c_int32), ('Start', ctypes.c_int32), ('Amount', ctypes.c_int32),
+        ('pData', ctypes.c_void_p)
+    ]
+
+def _native_client(client) -> tuple | None:
+    """
+    Returns the native library and client handle behind a python-snap7 client.
+    python-snap7 1.x exposes them as _lib/_s7_client, older releases as _library/_pointer.
+
+    :param client: snap7.client.Client: Client object.
+    :return: tuple | None: (library, handle), None for builds without a native library (or with other internals).
+    """
+    lib = getattr(client, '_lib', None) or getattr(client, '_library', None)
+    handle = getattr(client, '_s7_client', None) or getattr(client, '_pointer', None)
+    if lib is None or handle is None:
+        return None
+    return lib, handle
+
+def _shm_on_tmpfs() -> bool:
+    """
+    Checks that POSIX shared memory (/dev/shm) is a RAM backed tmpfs mount on Linux. Segments on any other
+    filesystem are mmapped files, written back to disk behind the frame writes.
+
+    :return: bool: False only if /dev/shm is known to be mounted with another filesystem type.
+    """
+    if not sys.platform.startswith('linux'):
+        return True
+    try:
+        with open('/proc/self/mounts') as mounts:
+            fs_types = {fields[1]: fields[2] for fields in (line.split() for line in mounts) if len(fields) > 2}
+    except OSError:
+        return True
+    return fs_types.get('/dev/shm', 'tmpfs') == 'tmpfs'
+
+def _fine_timer(enable: bool) -> None:
+    """
+    Switches the Windows system timer to 1 ms resolution while a logging thread runs, so the deadline pacing waits
+    are not rounded up to the default ~15.6 ms tick. Calls must be paired (enable, then disable). No-op elsewhere.
+
+    :param enable: bool: timeBeginPeriod(1) if True, timeEndPeriod(1) otherwise.
+    """
+    if sys.platform != 'win32':
+        return
+    try:
+        winmm = ctypes.WinDLL('winmm')
+        (winmm.timeBeginPeriod if enable else winmm.timeEndPeriod)(1)
+    except Exception:
+        pass
+
+def _is_transient(error: Exception | None) -> bool:
+    """
+    Tells if a write error may pass on its own (connection lost, PLC busy), so the write is worth retrying.
+    Errors reported by the CPU itself, e.g. a protection level refusing writes, are not.
+
+    :param error: Exception | None: Error raised by the snap7 client.
+    :return: bool: True if the write can be retried.
+    """
+    if isinstance(error, OSError):
+        return True
+    message = str(error)
+    return any(tag in message for tag in _TRANSIENT_ERRORS)
+
+def _run_logging(owner, cycle_time_ms: int | float, cycle, flush, stale) -> None:
+    """
+    Loop shared by Snap7DBSync and MultiDBReader: runs one read/publish/write cycle per period while owner.running
+    is True. Transient snap7 communication errors get a small backoff, other errors a quick reconnection of
+    owner.client. Ensures pacing to the requested cycle time against an absolute deadline schedule; owner._wake
+    cuts the wait short to serve synchronous writes without waiting for the next read.
+
+    :param owner: Snap7DBSync | MultiDBReader: Instance owning the snap7 client and the running flag.
+    :param cycle_time_ms: int | float: Targeted cycle time in milliseconds.
+    :param cycle: callable: Reads, publishes and writes once; raises on communication errors.
+    :param flush: callable: Performs the writes handed over while waiting.
+    :param stale: callable: Marks the DB images stale after an error, so writes read the PLC again.
+    """
+    cycle_s = max(0.001, float(cycle_time_ms)/1000)
+    backoff_s = 0.02
+    deadline = time.perf_counter() + cycle_s
+    while owner.running:
+        try:
+            cycle()
+        except Exception as e:
+            stale()
+            msg = str(e)
+            if "Job pending" in msg or "CLI :" in msg:
+                time.sleep(backoff_s)
+                continue
+            try:
+                owner.client.disconnect()
+            except Exception:
+                pass
+            time.sleep(backoff_s)
+            try:
+                owner.client.connect(owner.ip_addr, owner.rack, owner.slot)
+            except Exception:
+                time.sleep(backoff_s)
+            continue
+
+        # Absolute deadline pacing: the schedule stays phase-locked, so oversleeps do not accumulate as drift
+        now = time.perf_counter()
+        sleep_s = deadline - now
+        if sleep_s <= 0:
+            # Missed the slot: resync instead of bursting reads to catch up
+            deadline = now
+        while sleep_s > 0 and owner.running:
+            if owner._wake.wait(sleep_s):
+                owner._wake.clear()
+                flush()
+            sleep_s = deadline - time.perf_counter()
+        deadline += cycle_s
+
+class _WriteJob:
+    """
+    A synchronous write_to_plc call handed over to the logging thread, which owns the snap7 client while running.
+    """
+    __slots__ = ('changes', 'done', 'ok')
+
+    def __init__(self, changes: dict):
+        self.changes = changes
+        self.done = threading.Event()
+        self.ok = False
 
 class Snap7DBSync:
     """
@@ -12,7 +174,9 @@ class Snap7DBSync:
 
     This class requires TIA Portal blueprints (SCL or Table format) to build a memory map.
     The process of reading PLC data in a singular and cyclic read operation is done in the background.
-    The data from PLC DB is then flashed into python shared memory in the form of JSON string.
+    The raw PLC DB bytes are then flashed into python shared memory as a fixed binary frame,
+    so every variable sits at its DB offset behind a small seqlock header (sequence counter + length),
+    double buffered so readers never wait for the writer.
     This Shared memory is then available for using across different processes.
     """
     def __init__(
@@ -24,6 +188,7 @@ class Snap7DBSync:
             slot: int = 1,
             shm_name: str = "plc_shared_data",
             shm_size: int = 2048,
+            round_reals: int | None = None,
     ):
         """
         Initiates the metadata for the process and builds the memory map from the db blueprint file.
@@ -35,6 +200,9 @@ class Snap7DBSync:
         :param slot: int: PLC slot number from the TIA project. (Default: 1)
         :param shm_name: str: Unique name/identifier for the Shared memory segment.
         :param shm_size: int: Allocation size of the Shared memory segment. (Default: 2048)
+            Grown automatically when the frame (header + two DB slots) does not fit.
+        :param round_reals: int | None: Decimal places Real values are rounded to when read, None to return them
+            unrounded. (Default: None)
         """
         self.ip_addr = ip_addr
         self.rack = rack
@@ -43,18 +211,52 @@ class Snap7DBSync:
         self.client = None
         self._last_connect_error: str | None = None
         self.running = False
+        self.thread = None
         self.lock = threading.Lock()
+        self._pending_writes = {}
+        self._pending_attempts = {}
+        self._write_jobs = []
+        self._last_write_error = None
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._multi_reader = None
+        self.process = None
+        self._write_q = None
 
         self.shm = None
+        self._mv = None
         self.shm_name = shm_name
-        self.shm_size = shm_size
-        self._last_len = 0
+        self.db_bluprint_txt = db_bluprint_txt
+        self._seq = 0
+        self._last_buf = None
 
         self.total_len, self.data_struct = self.parse_siemens_db(db_bluprint_txt)
+        self._stride = _slot_stride(self.total_len)
+        self.shm_size = max(shm_size, _FRAME_PAYLOAD + 2 * self._stride)
         print("Total length: ", self.total_len, "Bytes")
         print("Data struct: ", self.data_struct)
         print("Total variables: ", len(self.data_struct))
 
+        # Reader side of the frame, shared by the read_* / get* methods of this instance
+        self._reader = SHMReader(self.data_struct, self.total_len, round_reals)
+
+        # Destination of every cyclic read, filled in place by the native snap7 call instead of allocating per cycle
+        self._read_buf = bytearray(self.total_len)
+        self._read_cbuf = (ctypes.c_uint8 * self.total_len).from_buffer(self._read_buf)
+        self._read_ref = ctypes.byref(self._read_cbuf)
+        self._native_client = None
+        self._native_read = None
+
+        # DB image reused by every write_to_plc call (guarded by self.lock) instead of allocating one per write.
+        # While logging runs it mirrors the last cyclic read, so writes can patch it without reading the PLC first.
+        self._write_scratch = bytearray(self.total_len)
+        self._scratch_fresh = False
+
+        # Per variable encoder patching a new value into a DB image, specialized once to the variable's offset/bit
+        self._encoders = {name: self._build_encoder(meta) for name, meta in self.data_struct.items()}
+        # Throwaway DB image the values are test-encoded into before they are queued, its content is never used
+        self._encode_probe = bytearray(self.total_len)
+
     # internal static helper methods
     @staticmethod
     def parse_siemens_db(content_path):
@@ -67,12 +269,8 @@ class Snap7DBSync:
 
         :param content: str: Path to the blueprint text file.
         :return: A tuple of (total_byte_length, data_structure_dictionary).
+            Variable types are stored lowercase ('bool', 'int', 'real', ...).
         """
-        types = {
-            'bool': (1, 0), 'byte': (1, 1), 'word': (2, 2), 'int': (2, 2),
-            'dword': (4, 2), 'dint': (4, 2), 'real': (4, 2), 'time': (4, 2)
-        }
-
         try:
             with open(content_path, 'r') as f:
                 file_content = f.read()
@@ -80,22 +278,24 @@ class Snap7DBSync:
             raise ValueError(f"Could not read blueprint file: {e}")
 
         data = {}
+        # End of the furthest variable seen so far (bools occupy their whole byte)
+        max_end = 0
 
         # --- ENGINE A: SCL PARSER (STRUCT based) ---
         if "STRUCT" in file_content:
             # Isolate the content between STRUCT and END_STRUCT to ignore headers/footers [cite: 1, 36]
-            struct_match = re.search(r'STRUCT(.*?)END_STRUCT', file_content, re.DOTALL | re.IGNORECASE)
+            struct_match = _STRUCT_RE.search(file_content)
             if struct_match:
                 relevant_content = struct_match.group(1)
-                # Pattern for 'Name : Type;' format [cite: 1]
-                pattern = r'^[ \t]*([a-zA-Z0-9_]+)\s*:\s*([a-zA-Z]+)\s*;'
 
                 byte_idx, bit_idx = 0, 0
-                for name, dtype in re.findall(pattern, relevant_content, re.MULTILINE):
+                # Pattern for 'Name : Type;' format [cite: 1]
+                for field in _SCL_FIELD_RE.finditer(relevant_content):
+                    name, dtype = field.groups()
                     dtype_key = dtype.lower()
-                    if dtype_key not in types: continue
+                    if dtype_key not in _S7_TYPES: continue
 
-                    size, align = types[dtype_key]
+                    size, align = _S7_TYPES[dtype_key]
 
                     # SCL Alignment Logic [cite: 1]
                     if dtype_key == 'bool':
@@ -109,7 +309,9 @@ class Snap7DBSync:
                         if align > 1 and byte_idx % 2 != 0:
                             byte_idx += 1
 
-                    data[name] = {'type': dtype, 'offset': byte_idx, 'bit': bit_idx, 'size': size}
+                    data[name] = {'type': dtype_key, 'offset': byte_idx, 'bit': bit_idx, 'size': size}
+                    if byte_idx + size > max_end:
+                        max_end = byte_idx + size
 
                     # Increment Counters for next iteration
                     if dtype_key == 'bool':
@@ -124,34 +326,68 @@ class Snap7DBSync:
             relevant_content = file_content[static_index:]
 
             # Pattern for 'Name Type Offset.Bit' format [cite: 34]
-            # Ignores shifting tabs and trailing comments automatically
-            pattern = r'^[ \t]*([a-zA-Z0-9_]+)[\s]+([a-zA-Z]+)[\s]+(\d+)\.(\d+)'
-
-            for name, dtype, off_byte, off_bit in re.findall(pattern, relevant_content, re.MULTILINE):
+            for field in _TABLE_FIELD_RE.finditer(relevant_content):
+                name, dtype, off_byte, off_bit = field.groups()
                 dtype_key = dtype.lower()
-                if dtype_key not in types: continue
+                if dtype_key not in _S7_TYPES: continue
 
+                size = _S7_TYPES[dtype_key][0]
                 data[name] = {
-                    'type': dtype,
+                    'type': dtype_key,
                     'offset': int(off_byte),
                     'bit': int(off_bit),
-                    'size': types[dtype_key][0]
+                    'size': size
                 }
+                if data[name]['offset'] + size > max_end:
+                    max_end = data[name]['offset'] + size
 
         # --- FINAL VALIDATION & SIZE CALCULATION ---
         if not data:
             return 0, {}
 
-        # Calculate total DB length (highest offset + its size)
-        last_item = max(data.values(), key=lambda x: x['offset'] + (0.1 * x['bit']))
-        total_size = last_item['offset'] + (1 if last_item['type'].lower() == 'bool' else last_item['size'])
-
+        # Total DB length is the end of the furthest variable, tracked while parsing
         # Standard DBs always end on an even byte boundary
-        if total_size % 2 != 0:
-            total_size += 1
+        total_size = max_end + (max_end % 2)
 
         return total_size, data
 
+    @staticmethod
+    def flatten_tags(tag_dict) -> tuple:
+        """
+        Flattens the DB structure into a table of plain tuples for extract_data.
+        Decoding many buffers of the same DB with the table skips the per-variable dictionary lookups.
+
+        :param tag_dict: dict: Dictionary of DB structure extracted from the db_blueprint_txt file.
+        :return: tuple: (name, type, offset, bit, unpack_from) per variable, unpack_from bound to the precompiled
+            Struct of the type.
+        """
+        return tuple(
+            (name, meta['type'], meta['offset'], meta['bit'], _STRUCTS[meta['type']].unpack_from)
+            for name, meta in tag_dict.items() if meta['type'] in _STRUCTS
+        )
+
+    @staticmethod
+    def _extract_flat(data_byte, flat_tags) -> dict:
+        """
+        extract_data over a table built by flatten_tags: tuple unpacking instead of dictionary lookups per variable.
+
+        :param data_byte: byte: Data in byte from the PLC.
+        :param flat_tags: tuple: Table returned by flatten_tags.
+        :return: A dictionary containing the variable names and their corresponding values.
+        """
+        results = {}
+        for name, dtype, offset, bit, unpack_from in flat_tags:
+            try:
+                if dtype == 'bool':
+                    results[name] = bool((data_byte[offset] >> bit) & 1)
+                elif dtype == 'byte':
+                    results[name] = data_byte[offset]
+                else:
+                    results[name] = unpack_from(data_byte, offset)[0]
+            except (IndexError, struct.error):
+                results[name] = None
+        return results
+
     @staticmethod
     def extract_data(data_byte, tag_dict) -> dict:
         """
@@ -159,24 +395,17 @@ class Snap7DBSync:
         The keys represent the variable names in the db_blueprint_txt file.
 
         :param data_byte: byte: Data in byte from the PLC.
-        :param tag_dict: dict: Dictionary of DB structure extracted from the db_blueprint_txt file.
+        :param tag_dict: dict | tuple: Dictionary of DB structure extracted from the db_blueprint_txt file,
+            or the table built from it by flatten_tags (faster when decoding the same DB repeatedly).
         :return: A dictionary containing the variable names and their corresponding values.
         """
+        if not isinstance(tag_dict, dict):
+            return Snap7DBSync._extract_flat(data_byte, tag_dict)
         results = {}
 
-        # Map S7 types to Python Struct formats (Big-Endian '>' is required for PLC)
-        # >h = Short (Int), >H = Unsigned Short (Word)
-        # >i = Long (DInt), >I = Unsigned Long (DWord)
-        # >f = Float (Real)
-        type_map = {
-            'int': '>h', 'word': '>H',
-            'dint': '>i', 'dword': '>I',
-            'real': '>f', 'time': '>i'
-        }
-
         for name, meta in tag_dict.items():
             offset = meta['offset']
-            dtype = meta['type'].lower()
+            dtype = meta['type']
 
             try:
                 if dtype == 'bool':
@@ -189,102 +418,279 @@ class Snap7DBSync:
                     # Simple byte read, no unpacking needed
                     results[name] = data_byte[offset]
 
-                elif dtype in type_map:
+                elif dtype in _STRUCTS:
                     # Handle Multi-byte types (Int, Word, Real, etc.)
-                    size = meta['size']
-                    fmt = type_map[dtype]
-
-                    # Slice the byte array and unpack
-                    raw_val = struct.unpack(fmt, data_byte[offset:offset + size])[0]
-
-                    # Optional: Round Real values to 4 decimals for cleaner output
-                    if dtype == 'real':
-                        raw_val = round(raw_val, 4)
-
-                    results[name] = raw_val
-            except IndexError:
+                    # Unpack in place with the precompiled Struct, no slicing or format parsing
+                    # (measured ~2.5x faster than int.from_bytes on a slice, which has to allocate the slice)
+                    results[name] = _STRUCTS[dtype].unpack_from(data_byte, offset)[0]
+            except (IndexError, struct.error):
                 # Safety for cases where reading less data than defined
                 results[name] = None
         return results
 
+    @staticmethod
+    def _build_encoder(meta):
+        """
+        Builds the function patching a value of a single variable into a DB image.
+        Ensures bit-level accuracy for Booleans and proper byte-swapping for multibyte types.
+
+        :param meta: dict: Metadata of the variable extracted from the db_blueprint_txt file.
+        :return: Callable[[bytearray, value], None] | None: None for unsupported types.
+        """
+        offset = meta['offset']
+        dtype = meta['type']
+        if dtype == 'bool':
+            return lambda buf, v, o=offset, b=meta['bit']: snap7.util.set_bool(buf, o, b, bool(v))
+        if dtype == 'int':
+            return lambda buf, v, o=offset: snap7.util.set_int(buf, o, int(v))
+        if dtype == 'real':
+            return lambda buf, v, o=offset: snap7.util.set_real(buf, o, float(v))
+        if dtype == 'word':
+            return lambda buf, v, o=offset: snap7.util.set_word(buf, o, int(v))
+        if dtype == 'byte':
+            def set_byte(buf, v, o=offset):
+                buf[o] = int(v) & 0xFF
+            return set_byte
+        if dtype == 'dint' or dtype == 'time':
+            return lambda buf, v, o=offset: snap7.util.set_dint(buf, o, int(v))
+        if dtype == 'dword':
+            return lambda buf, v, o=offset: snap7.util.set_dword(buf, o, int(v))
+        return None
+
     # internal helper methods
-    def _read_db(self) -> bytes:
+    def _bind_native_read(self) -> None:
+        """
+        Looks up Cli_DBRead and the client handle of the current snap7 client, for _read_db_into.
+        Builds without a native library leave it unbound and use db_read instead.
+        """
+        native = _native_client(self.client)
+        func = getattr(native[0], 'Cli_DBRead', None) if native is not None else None
+        self._native_read = (func, native[1]) if func is not None else None
+        self._native_client = self.client
+
+    def _read_db_into(self) -> bytearray:
+        """
+        Performs singular read operation from the PLC DB into the preallocated read buffer.
+        The native Cli_DBRead writes straight into the buffer, so no bytes object is allocated per cycle.
+
+        :return: bytearray: self._read_buf, holding the data from PLC until the next read.
+        """
+        if self._native_client is not self.client:
+            self._bind_native_read()
+        if self._native_read is None:
+            self._read_buf[:] = self.client.db_read(self.db_num, 0, self.total_len)
+            return self._read_buf
+        func, handle = self._native_read
+        result = func(handle, self.db_num, 0, self.total_len, self._read_ref)
+        if result:
+            snap7.common.check_error(result, context="client")
+        return self._read_buf
+
+    def _publish_read(self, buf: bytearray) -> None:
         """
-        Performs singular read operation from the PLC DB in bytes.
+        Takes over a fresh cyclic read of the DB: mirrors it into the write scratch buffer and publishes it in
+        the Shared Memory frame when the raw DB bytes changed. Called with self.lock held.
 
-        :return: bytes: Data from PLC.
+        :param buf: bytearray: Raw DB data as read from the PLC in this cycle.
         """
-        return self.client.db_read(self.db_num, 0, self.total_len)
+        self._write_scratch[:] = buf
+        self._scratch_fresh = True
+
+        # Only update shared memory if the raw DB bytes actually changed
+        # buf is overwritten by the next read, so the published image is kept as an immutable copy
+        if buf != self._last_buf:
+            self._update_shared(buf)
+            self._last_buf = bytes(buf)
 
     def _update_shared(self, payload: bytes) -> None:
         """
-        Writes a byte payload into the Shared Memory buffer.
+        Writes the raw DB bytes into the inactive slot of the Shared Memory frame and publishes it.
 
-        If the new payload is smaller than the previous one, the difference is zero-filled to prevent stale data.
-        Truncates if payload exceeds shm_size.
-        Updates _self.last_len with the number of bytes written.
+        The PLC bytes are already big-endian, so they are copied as they are without any re-encoding.
+        The copy is guarded by the seqlock: the sequence is made odd before and bumped to the next even value after,
+        which also flips the published slot. Readers of the previous frame keep reading an untouched slot.
 
-        :param payload: bytes: Data to be stored in shared memory. UTF-8 encoded bytes (typically a JSON string).
+        :param payload: bytes: Raw DB data as received from the PLC.
         """
-        if not self.shm: return
-        mv = self.shm.buf
+        mv = self._mv
+        if mv is None: return
         payload_len = len(payload)
-        if payload_len > self.shm_size:
-            payload = payload[:self.shm_size]
-            payload_len = self.shm_size
-        mv[:payload_len] = payload
-        if self._last_len > payload_len:
-            tail = self._last_len - payload_len
-            mv[payload_len:payload_len + tail] = b"\x00"*tail
-        self._last_len = payload_len
+        _FRAME_HEADER.pack_into(mv, 0, self._seq | 1, payload_len)
+        slot = _slot_offset(self._seq + 2, self._stride)
+        mv[slot:slot + payload_len] = payload
+        self._seq += 2
+        _FRAME_HEADER.pack_into(mv, 0, self._seq, payload_len)
 
-    # main logging method
-    def _logging_loop(self, cycle_time_ms : int | float) -> None:
+    def _flush_pending_writes(self) -> None:
+        """
+        Writes all changes queued by write_to_plc(flush=False) and all synchronous writes handed over to the
+        logging thread to the PLC in a single Read-Patch-Write cycle, then reports the result to the waiting callers.
+        On a temporary error (connection lost, PLC busy) the queued changes are queued again, unless newer values
+        for the same variables were queued or written meanwhile, and dropped after _WRITE_RETRIES attempts.
+        Other errors, e.g. the PLC refusing the write, drop them right away.
+        """
+        with self._pending_lock:
+            queued, self._pending_writes = self._pending_writes, {}
+            jobs, self._write_jobs = self._write_jobs, []
+        if not queued and not jobs:
+            return
+        changes = dict(queued)
+        merged = []
+        for job in jobs:
+            # A job with a value that cannot be encoded fails on its own instead of failing the whole transaction
+            if self._reject_invalid(job.changes)[1]:
+                job.ok = False
+                job.done.set()
+                continue
+            changes.update(job.changes)
+            merged.append(job)
+        self._last_write_error = None
+        ok = self._write_changes(changes)
+        for job in merged:
+            job.ok = ok
+            job.done.set()
+        if not queued:
+            return
+        with self._pending_lock:
+            if ok:
+                for name in queued:
+                    self._pending_attempts.pop(name, None)
+                return
+            transient = _is_transient(self._last_write_error)
+            for name, value in queued.items():
+                attempts = self._pending_attempts.pop(name, 0) + 1
+                if name in self._pending_writes or any(name in job.changes for job in merged):
+                    # Superseded by a newer value
+                    continue
+                if not transient or attempts > _WRITE_RETRIES:
+                    print(f"Write error: queued write of {name} dropped")
+                    continue
+                self._pending_writes[name] = value
+                self._pending_attempts[name] = attempts
+
+    def _reject_invalid(self, changes: dict) -> tuple:
         """
-        Main background loop that cyclically reads the PLC data, extracts values, and updates the shared memory.
-        The loop runs when sel.running is True, handles transient snap7 communication errors with a small backoff
-        followed by a quick reconnection when needed. Ensures pacing to the requested cycle time.
+        Separates the changes that can be encoded into the DB from those with an invalid value (wrong type or
+        out of range), by encoding them into a throwaway image. Variables unknown to the blueprint are dropped.
+        An error is printed for every rejected variable.
 
-        :param cycle_time_ms: int | float: Targeted cycle time in milliseconds.
+        :param changes: dict: Dictionary of changes: { "variable_name": new_value }.
+        :return: tuple: ({ "variable_name": new_value } of the valid changes, [names of the rejected variables]).
         """
-        cycle_s = max(0.001, float(cycle_time_ms)/1000)
-        backoff_s = 0.02
-        last_values = None
-        while self.running:
-            t0 = time.perf_counter()
+        valid, rejected = {}, []
+        for name, value in changes.items():
+            encoder = self._encoders.get(name)
+            if encoder is None:
+                continue
             try:
-                with self.lock:
-                    buf = self._read_db()
-                    values = self.extract_data(buf, self.data_struct)
-
-                # Only update shared memory if data actually changed
-                if values != last_values:
-                    payload = json.dumps(values, separators=(',', ':')).encode('utf-8')
-                    self._update_shared(payload)
-                    last_values = values
+                encoder(self._encode_probe, value)
             except Exception as e:
-                msg = str(e)
-                if "Job pending" in msg or "CLI :" in msg:
-                    time.sleep(backoff_s)
-                    continue
-                try:
-                    self.client.disconnect()
-                except Exception:
-                    pass
-                time.sleep(backoff_s)
-                try:
-                    self.client.connect(self.ip_addr, self.rack, self.slot)
-                except Exception:
-                    time.sleep(backoff_s)
-                continue
-            except Exception:
-                time.sleep(backoff_s)
+                print(f"Write error: invalid value {value!r} for {name}: {e}")
+                rejected.append(name)
                 continue
+            valid[name] = value
+        return valid, rejected
 
-            elapsed = time.perf_counter() - t0
-            sleep_s = cycle_s - elapsed
-            if sleep_s > 0:
-                time.sleep(sleep_s)
+    def _stop_process(self) -> None:
+        """
+        Stops the logging process started by start_logging_in_process.
+        The stop request travels behind the queued writes, so the process writes all of them before exiting.
+        """
+        self._write_q.put(None)
+        self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self._write_q.cancel_join_thread()
+        self._write_q.close()
+        self.process = None
+        self._write_q = None
+        # Continue the frame sequence published by the process
+        if self._mv is not None:
+            self._seq = _FRAME_HEADER.unpack_from(self._mv, 0)[0] & ~1
+        self._last_buf = None
+
+    def _dirty_ranges(self, names: list) -> list:
+        """
+        Returns the byte ranges covering the given variables, merged when they are at most _WRITE_MERGE_GAP
+        bytes apart: a bigger gap costs more as rewritten bytes than as one more request.
+
+        :param names: list: Variable names from the db_blueprint_txt file.
+        :return: list: Sorted [(start, end)] absolute byte ranges, end exclusive.
+        """
+        spans = sorted(
+            (self.data_struct[name]['offset'], self.data_struct[name]['offset'] + self.data_struct[name]['size'])
+            for name in names
+        )
+        ranges = [list(spans[0])]
+        for lo, hi in spans[1:]:
+            if lo - ranges[-1][1] <= _WRITE_MERGE_GAP:
+                ranges[-1][1] = max(ranges[-1][1], hi)
+            else:
+                ranges.append([lo, hi])
+        return [(lo, hi) for lo, hi in ranges]
+
+    def _write_changes(self, changes: dict) -> bool:
+        """
+        Updates specific variables in the PLC via a Read-Patch-Write cycle of the byte ranges holding them.
+        Variables closer than _WRITE_MERGE_GAP bytes share one range, every range is written with its own db_write.
+        While logging runs, the ranges are patched on the DB image of the last cyclic read instead of being read
+        from the PLC first, saving one round trip.
+
+        :param changes: dict: Dictionary of changes to be written: { "variable_name": new_value }.
+        :return: bool: True if to write was successful false otherwise.
+        """
+        targets = [name for name in changes if self._encoders.get(name) is not None]
+        if not targets:
+            return True
+        ranges = self._dirty_ranges(targets)
+        with self.lock:
+            try:
+                # 1. Current state of the ranges to ensure we only change the targeted bits/bytes
+                # The scratch buffer is reused across writes and keeps absolute DB offsets
+                # It already holds the last cyclic read (plus our own writes since) while logging runs
+                current_buffer = self._write_scratch
+                if not self._scratch_fresh:
+                    for lo, hi in ranges:
+                        current_buffer[lo:hi] = self.client.db_read(self.db_num, lo, hi - lo)
+
+                # 2. Patch every known variable through its precomputed encoder
+                for name in targets:
+                    self._encoders[name](current_buffer, changes[name])
+
+                # 3. Write the patched ranges back to the PLC
+                for lo, hi in ranges:
+                    self.client.db_write(self.db_num, lo, current_buffer[lo:hi])
+                return True
+
+            except Exception as e:
+                # The patched image may not match the PLC anymore, read it again on the next write
+                self._scratch_fresh = False
+                self._last_write_error = e
+                print(f"Write error: {e}")
+                return False
+
+    # main logging method
+    def _logging_loop(self, cycle_time_ms : int | float) -> None:
+        """
+        Main background loop that cyclically reads the PLC data and flashes the raw DB bytes into the shared memory.
+        While it runs, this thread performs every snap7 call: changes queued by write_to_plc(flush=False) are
+        written after each read, synchronous writes wake the loop between cycles and are written right away.
+        The loop runs when self.running is True; error handling and pacing are those of _run_logging.
+
+        :param cycle_time_ms: int | float: Targeted cycle time in milliseconds.
+        """
+        def cycle():
+            # The lock only guards the hand-over with direct writes when logging starts/stops
+            with self.lock:
+                self._publish_read(self._read_db_into())
+            # Drain the writes queued since the last cycle as one PLC transaction
+            self._flush_pending_writes()
+
+        def stale():
+            self._scratch_fresh = False
+
+        _run_logging(self, cycle_time_ms, cycle, self._flush_pending_writes, stale)
 
     # public methods
     def connect(self):
@@ -299,7 +705,15 @@ class Snap7DBSync:
         """
         try:
             if self.shm is None:
+                if not _shm_on_tmpfs():
+                    print("Warning: /dev/shm is not a tmpfs mount, shared memory writes may hit the disk")
                 self.shm = shared_memory.SharedMemory(create=True, size=self.shm_size, name=self.shm_name)
+                # Cached once: every frame write goes through this view of the segment
+                self._mv = self.shm.buf.cast('B')
+                # Fault every page in now, so the first frame writes do not stall on page allocation
+                self._mv[:] = bytes(len(self._mv))
+                self._reader.attach(self.shm)
+                self._last_buf = None
             self.client = snap7.client.Client()
             time.sleep(0.5)
             self.client.connect(self.ip_addr, self.rack, self.slot)
@@ -329,74 +743,177 @@ class Snap7DBSync:
         """
         return self._last_connect_error
 
+    def read_variable(self, name: str):
+        """
+        Reads a single variable from the Shared Memory frame. See SHMReader.read_variable.
+        """
+        return self._reader.read_variable(name)
+
+    def read_variables(self, names) -> dict | None:
+        """
+        Reads a subset of variables from the Shared Memory frame. See SHMReader.read_variables.
+        """
+        return self._reader.read_variables(names)
+
+    def read_all_variables(self) -> dict | None:
+        """
+        Reads the entire PLC Data Block image from the Shared Memory frame. See SHMReader.read_all_variables.
+        """
+        return self._reader.read_all_variables()
+
+    def read_all_json(self) -> bytes | None:
+        """
+        Reads the entire PLC Data Block image as a compact JSON document. See SHMReader.read_all_json.
+        """
+        return self._reader.read_all_json()
+
+    def get(self, name: str):
+        """
+        Returns a single variable from the cached decode of the current frame. See SHMReader.get.
+        """
+        return self._reader.get(name)
+
+    def get_many(self, names) -> dict | None:
+        """
+        Returns a subset of variables from the cached decode of the current frame. See SHMReader.get_many.
+        """
+        return self._reader.get_many(names)
+
+    def read_record(self, out=None):
+        """
+        Reads the entire PLC Data Block image as a NumPy structured record. See SHMReader.read_record.
+        """
+        return self._reader.read_record(out)
+
     def start_logging(self, cycle_time_ms: int | float = 20) -> None:
         """
         Starts the background logging in a thread as daemon with a specific cycle time.
         If logging is already active the call is ignored.
+        On Windows the system timer resolution is raised to 1 ms until stop_logging, for sub-tick cycle times.
+        When the instance was added to a MultiDBReader no thread is started: the DB is read and published by the
+        reader's loop, at the reader's cycle time, once that is started.
 
         :param cycle_time_ms: int | float: Targeted cycle time in milliseconds. (default: 20ms)
         """
-        if self.running:
+        if self.running or self.process is not None:
+            return
+        if self._multi_reader is not None:
+            self.running = True
             return
         self.running = True
+        self._wake.clear()
+        _fine_timer(True)
         self.thread = threading.Thread(target=self._logging_loop, args=(cycle_time_ms,), daemon=True, name="Snap7DBDync")
         self.thread.start()
 
-    def write_to_plc(self, changes: dict):
+    def start_logging_in_process(self, cycle_time_ms: int | float = 20) -> bool:
+        """
+        Starts the background logging in a separate daemon process instead of a thread, so the cyclic reads and
+        frame writes do not compete with this process for the GIL.
+        The process opens its own PLC connection and writes into the Shared Memory created by connect(), which
+        must have been called first; read methods of this instance keep working on the same segment.
+        write_to_plc only queues the changes for the process, which writes them after its next read.
+        Stopped by stop_logging / close_connection.
+
+        :param cycle_time_ms: int | float: Targeted cycle time in milliseconds. (default: 20ms)
+        :return: bool: True if the process was started, False if logging is already active or SHM is not allocated.
+        """
+        if self.running or self.process is not None or self.shm is None or self._multi_reader is not None:
+            return False
+        self._write_q = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=_logging_process,
+            args=(self.ip_addr, self.db_num, self.db_bluprint_txt, self.rack, self.slot, self.shm_name,
+                  cycle_time_ms, self._write_q),
+            daemon=True,
+            name="Snap7DBSync"
+        )
+        self.process.start()
+        return True
+
+    def write_to_plc(self, changes: dict, flush: bool = True):
         """
         Updates specific variables in the PLC via a Read-Patch-Write cycle.
         Thread-safe method that ensures bit-level accuracy for Booleans and proper byte-swapping for multibyte types.
+        Only the bytes of the changed variables are read and written back, not the whole DB; variables up to
+        16 bytes apart are sent as one range, distant ones with separate db_write calls.
+        While logging runs, the write is performed by the logging thread, which owns the snap7 client; the ranges are
+        patched on the DB image of the last cyclic read instead of being read from the PLC first, saving one round
+        trip. Other variables inside a range are then written back with values at most one cycle old.
         The values are not written in the shared memory here; cyclic logging should reflect the changes into shared memory.
 
+        With flush=False and logging active, the changes are only queued and the call returns immediately.
+        All changes queued during a cycle are merged (last value wins) and written by the logging thread
+        in one PLC transaction after its next read.
+        While logging runs in a process (start_logging_in_process), every write is queued that way for the process.
+        Values that cannot be encoded (wrong type or out of range) are not queued and make the call return False;
+        the valid ones are queued all the same.
+
         :param changes: dict: Dictionary of changes to be written: { "variable_name": new_value }.
-        :return: bool: True if to write was successful false otherwise.
+        :param flush: bool: Write synchronously instead of queueing for the logging thread. (Default: True)
+        :return: bool: True if to write was successful (or queued) false otherwise.
         """
         if not isinstance(changes, dict) or not changes:
             return False
-        with self.lock:
-            try:
-                # 1. Read current state to ensure we only change the targeted bits/bytes
-                current_buffer = bytearray(self._read_db())
-
-                for name, value in changes.items():
-                    if name not in self.data_struct:
-                        continue
-
-                    meta = self.data_struct[name]
-                    offset = meta['offset']
-                    dtype = meta['type'].lower()
-
-                    # Logic for all types identified in your parser
-                    if dtype == 'bool':
-                        snap7.util.set_bool(current_buffer, offset, meta['bit'], bool(value))
-                    elif dtype == 'int':
-                        snap7.util.set_int(current_buffer, offset, int(value))
-                    elif dtype == 'real':
-                        snap7.util.set_real(current_buffer, offset, float(value))
-                    elif dtype == 'word':
-                        snap7.util.set_word(current_buffer, offset, int(value))
-                    elif dtype == 'byte':
-                        current_buffer[offset] = int(value) & 0xFF
-                    elif dtype == 'dint' or dtype == 'time':
-                        snap7.util.set_dint(current_buffer, offset, int(value))
-                    elif dtype == 'dword':
-                        snap7.util.set_dword(current_buffer, offset, int(value))
-
-                # 3. Write the patched buffer back to the PLC
-                self.client.db_write(self.db_num, 0, current_buffer)
-                return True
-
-            except Exception as e:
-                print(f"Write error: {e}")
-                return False
+        if self.process is None and (not self.running or threading.current_thread() is self.thread):
+            with self._pending_lock:
+                # A queued older value must not overwrite this one when the queue is flushed later
+                for name in changes:
+                    self._pending_writes.pop(name, None)
+                    self._pending_attempts.pop(name, None)
+            return self._write_changes(changes)
+        if self.process is not None or not flush:
+            # Values that can never be encoded are rejected here instead of failing the queued transaction
+            valid, rejected = self._reject_invalid(changes)
+            if valid:
+                if self.process is not None:
+                    self._write_q.put(valid)
+                else:
+                    with self._pending_lock:
+                        self._pending_writes.update(valid)
+                        for name in valid:
+                            self._pending_attempts.pop(name, None)
+            return not rejected
+        job = _WriteJob(changes)
+        with self._pending_lock:
+            self._write_jobs.append(job)
+        self._wake.set()
+        if not job.done.wait(timeout=2.0):
+            with self._pending_lock:
+                if job in self._write_jobs:
+                    # Still not picked up (e.g. the loop is reconnecting): withdraw it so it never lands later
+                    self._write_jobs.remove(job)
+                    print("Write error: logging thread did not pick up the write")
+                    return False
+            # Picked up meanwhile, the transaction is in flight
+            job.done.wait()
+        return job.ok
 
     def stop_logging(self) -> None:
         """
-        Stops the background logging thread with a small timeout.
+        Stops the background logging thread (or process) with a small timeout.
+        Writes still queued by write_to_plc are flushed to the PLC once; those that fail are discarded, so they are
+        not replayed over newer values when logging is started again.
         """
+        if self.process is not None:
+            self._stop_process()
+            return
+        was_running = self.running
         self.running = False
-        if hasattr(self, 'thread'):
+        self._wake.set()
+        if self.thread is not None and self._multi_reader is None:
             self.thread.join(timeout=2.0)
+            if was_running:
+                _fine_timer(False)
+        # Under the lock so a MultiDBReader cycle in flight cannot mark the scratch fresh again afterwards
+        with self.lock:
+            self._scratch_fresh = False
+        self._flush_pending_writes()
+        with self._pending_lock:
+            for name in self._pending_writes:
+                print(f"Write error: queued write of {name} dropped")
+            self._pending_writes = {}
+            self._pending_attempts = {}
 
     def close_connection(self) -> None:
         """
@@ -407,13 +924,17 @@ class Snap7DBSync:
 
         This method is suggested to be executed always at the end as cleanup.
         """
-        if self.running:
+        if self.running or self.process is not None:
             self.stop_logging()
             try:
                 self.client.disconnect()
                 self.client.destroy()
             except Exception:
                 pass
+        self._reader.detach()
+        if self._mv is not None:
+            self._mv.release()
+            self._mv = None
         try:
             self.shm.close()
         except Exception:
@@ -423,3 +944,308 @@ class Snap7DBSync:
             self.shm = None
         except FileNotFoundError:
             pass
+
+
+class MultiDBReader:
+    """
+    Reads the DBs of several Snap7DBSync instances on the same PLC with one ReadMultiVars request per cycle,
+    instead of one read round trip per instance and DB.
+
+    Added instances keep their own blueprint, Shared Memory and snap7 client, which is still used for their writes.
+    The reader owns one more snap7 client and a single background thread that, for every added instance with
+    logging started, reads the DB straight into the instance's read buffer, publishes it and performs its writes.
+    The DBs are packed into as few requests as the negotiated PDU size allows (at most 20 per request);
+    a DB too large for one PDU is read on its own with a regular DB read.
+    """
+    def __init__(self, ip_addr: str, rack: int = 0, slot: int = 1):
+        """
+        Initializes the reader. The PLC connection is made by connect().
+
+        :param ip_addr: str: IP address of the PLC.
+        :param rack: int: PLC rack number from the TIA project. (Default: 0)
+        :param slot: int: PLC slot number from the TIA project. (Default: 1)
+        """
+        self.ip_addr = ip_addr
+        self.rack = rack
+        self.slot = slot
+        self.client = None
+        self._last_connect_error: str | None = None
+        self.syncs = []
+        self.running = False
+        self.thread = None
+        self._wake = threading.Event()
+
+        # Read plan of the instances currently logging, rebuilt when that set or the client changes
+        self._active = []
+        self._planned_client = None
+        self._multi_read = None
+        self._batches = []
+        self._singles = []
+
+    # internal helper methods
+    def _plan(self, syncs: list) -> None:
+        """
+        Packs the DB reads of the given instances into ReadMultiVars requests fitting the negotiated PDU.
+        Every item points straight at the read buffer of its instance, so the response is demultiplexed by snap7.
+
+        :param syncs: list: Snap7DBSync instances to read every cycle.
+        """
+        native = _native_client(self.client)
+        func = getattr(native[0], 'Cli_ReadMultiVars', None) if native is not None else None
+        self._multi_read = (func, native[1]) if func is not None else None
+        self._active = syncs
+        self._planned_client = self.client
+        self._batches = []
+        self._singles = []
+        if self._multi_read is None:
+            self._singles = list(syncs)
+            return
+
+        try:
+            pdu = int(self.client.get_pdu_length())
+        except Exception:
+            pdu = 240  # smallest PDU any S7 CPU negotiates
+        # Response: 14 bytes of header, then per item 4 bytes of header and the data padded to an even length
+        # Request: 12 bytes of header, then 12 bytes per item
+        budget = pdu - 14
+        batches, batch, used = [], [], 0
+        for sync in syncs:
+            cost = 4 + sync.total_len + (sync.total_len & 1)
+            if cost > budget:
+                self._singles.append(sync)
+                continue
+            if used + cost > budget or len(batch) == _S7_MAX_VARS or 12 + 12 * (len(batch) + 1) > pdu:
+                batches.append(batch)
+                batch, used = [], 0
+            batch.append(sync)
+            used += cost
+        if batch:
+            batches.append(batch)
+
+        for batch in batches:
+            items = (_S7DataItem * len(batch))()
+            for item, sync in zip(items, batch):
+                item.Area = _S7_AREA_DB
+                item.WordLen = _S7_WL_BYTE
+                item.DBNumber = sync.db_num
+                item.Start = 0
+                item.Amount = sync.total_len
+                item.pData = ctypes.addressof(sync._read_cbuf)
+            self._batches.append((batch, items, ctypes.c_int32(len(batch))))
+
+    def _read_all(self) -> list:
+        """
+        Reads the DB of every planned instance into its read buffer.
+        An item rejected by the PLC (e.g. missing DB) only skips its instance for this cycle.
+
+        :return: list: Snap7DBSync instances whose read buffer holds a fresh read.
+        """
+        fresh = []
+        if self._batches:
+            func, handle = self._multi_read
+            for batch, items, count in self._batches:
+                result = func(handle, ctypes.byref(items), count)
+                if result:
+                    snap7.common.check_error(result, context="client")
+                fresh.extend(sync for sync, item in zip(batch, items) if item.Result == 0)
+        for sync in self._singles:
+            sync._read_buf[:] = self.client.db_read(sync.db_num, 0, sync.total_len)
+            fresh.append(sync)
+        return fresh
+
+    # main logging method
+    def _logging_loop(self, cycle_time_ms : int | float) -> None:
+        """
+        Main background loop reading every logging instance in batched requests, publishing the DB images and
+        performing the writes of the instances. Same error handling and deadline pacing as Snap7DBSync (_run_logging).
+
+        :param cycle_time_ms: int | float: Targeted cycle time in milliseconds.
+        """
+        active = []
+
+        def cycle():
+            active[:] = [sync for sync in self.syncs if sync.running]
+            if active != self._active or self._planned_client is not self.client:
+                self._plan(list(active))
+            for sync in self._read_all():
+                with sync.lock:
+                    # Skipped if its logging was stopped meanwhile, stop_logging has already flushed it
+                    if sync.running:
+                        sync._publish_read(sync._read_buf)
+            flush()
+
+        def flush():
+            for sync in active:
+                sync._flush_pending_writes()
+
+        def stale():
+            for sync in active:
+                sync._scratch_fresh = False
+
+        _run_logging(self, cycle_time_ms, cycle, flush, stale)
+
+    # public methods
+    def add(self, sync: Snap7DBSync) -> bool:
+        """
+        Adds a Snap7DBSync instance to the batched reads. Its start_logging/stop_logging then only enable or
+        disable it in the loop of this reader instead of running a thread of its own.
+
+        :param sync: Snap7DBSync: Instance to add, connected or not, but not logging yet.
+        :return: bool: True if added, False if it is already logging or already added to a reader.
+        """
+        if sync.running or sync._multi_reader is not None:
+            return False
+        sync._multi_reader = self
+        # Writes submitted to the instance wake this reader's loop
+        sync._wake = self._wake
+        sync.thread = self.thread
+        self.syncs.append(sync)
+        return True
+
+    def connect(self) -> bool:
+        """
+        Establishes the PLC connection used for the batched reads.
+
+        :return: bool: True if connection is successful.
+        """
+        try:
+            self.client = snap7.client.Client()
+            self.client.connect(self.ip_addr, self.rack, self.slot)
+            return bool(self.client.get_connected())
+        except Exception as e:
+            self._last_connect_error = e
+            return False
+
+    def last_connect_error(self) -> str | None:
+        """
+        Returns the last connection error message.
+
+        :return: str | None: last connection error message.
+        """
+        return self._last_connect_error
+
+    def start_logging(self, cycle_time_ms: int | float = 20) -> None:
+        """
+        Starts the background reading in a thread as daemon with a specific cycle time.
+        Added instances take part once their own start_logging has been called.
+        If logging is already active the call is ignored.
+
+        :param cycle_time_ms: int | float: Targeted cycle time in milliseconds. (default: 20ms)
+        """
+        if self.running:
+            return
+        self.running = True
+        self._wake.clear()
+        _fine_timer(True)
+        self.thread = threading.Thread(target=self._logging_loop, args=(cycle_time_ms,), daemon=True, name="Snap7MultiDBReader")
+        for sync in self.syncs:
+            sync.thread = self.thread
+        self.thread.start()
+
+    def stop_logging(self) -> None:
+        """
+        Stops the background reading thread with a small timeout and the logging of every added instance.
+        Writes still queued on the instances are flushed to the PLC.
+        """
+        was_running = self.running
+        self.running = False
+        self._wake.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2.0)
+            if was_running:
+                _fine_timer(False)
+        for sync in self.syncs:
+            sync.stop_logging()
+
+    def close_connection(self) -> None:
+        """
+        Stops the batched reading and disconnects the PLC client of the reader.
+        The added instances keep their Shared Memory; close them with their own close_connection.
+        """
+        self.stop_logging()
+        try:
+            self.client.disconnect()
+            self.client.destroy()
+        except Exception:
+            pass
+
+
+def _logging_process(
+        ip_addr: str,
+        db_num: int,
+        db_bluprint_txt: str,
+        rack: int,
+        slot: int,
+        shm_name: str,
+        cycle_time_ms: int | float,
+        write_q
+) -> None:
+    """
+    Entry point of the process started by Snap7DBSync.start_logging_in_process.
+    Runs the logging loop of a Snap7DBSync attached to the existing Shared Memory segment of the parent, which
+    stays its owner. A helper thread forwards the writes of the parent as queued writes until None is received.
+
+    :param ip_addr: str: IP address of the PLC.
+    :param db_num: int: Non optimized datablock number of the PLC.
+    :param db_bluprint_txt: str: Path to the .txt file containing the data structure of the intended DB.
+    :param rack: int: PLC rack number from the TIA project.
+    :param slot: int: PLC slot number from the TIA project.
+    :param shm_name: str: Name of the Shared memory segment created by the parent.
+    :param cycle_time_ms: int | float: Targeted cycle time in milliseconds.
+    :param write_q: multiprocessing.Queue: Changes submitted by the parent, None to stop.
+    """
+    sync = Snap7DBSync(ip_addr, db_num, db_bluprint_txt, rack, slot, shm_name)
+    # Attached, not created: the resource tracker is shared with the parent, which unlinks the segment
+    sync.shm = shared_memory.SharedMemory(name=shm_name)
+    sync._mv = sync.shm.buf.cast('B')
+    sync._seq = _FRAME_HEADER.unpack_from(sync._mv, 0)[0] & ~1
+    sync.connect()
+    sync.running = True
+
+    def forward_writes():
+        parent = multiprocessing.parent_process()
+        while True:
+            try:
+                changes = write_q.get(timeout=1.0)
+            except queue.Empty:
+                if parent is not None and not parent.is_alive():
+                    break
+                continue
+            if changes is None:
+                break
+            sync.write_to_plc(changes, flush=False)
+        sync.running = False
+        sync._wake.set()
+
+    threading.Thread(target=forward_writes, daemon=True, name="Snap7DBSyncWrites").start()
+    _fine_timer(True)
+    try:
+        sync._logging_loop(cycle_time_ms)
+        sync._flush_pending_writes()
+    finally:
+        _fine_timer(False)
+        try:
+            sync.client.disconnect()
+            sync.client.destroy()
+        except Exception:
+            pass
+        sync._mv.release()
+        sync.shm.close()
+
+
+def attach_reader(shm_name: str, db_bluprint_txt: str, round_reals: int | None = None) -> SHMReader:
+    """
+    Attaches a reader to the Shared Memory frame of a Snap7DBSync instance running in another process.
+    The segment is mapped once and the reader keeps its own decode cache; call close() on it when done.
+    The attaching process does not take ownership: the segment is left alive when it exits.
+
+    :param shm_name: str: Name of the Shared memory segment given to Snap7DBSync.
+    :param db_bluprint_txt: str: Path to the same blueprint file used by Snap7DBSync.
+    :param round_reals: int | None: Decimal places Real values are rounded to when read, None to return them
+        unrounded. (Default: None)
+    :return: SHMReader: Reader attached to the segment.
+    """
+    total_len, data_struct = Snap7DBSync.parse_siemens_db(db_bluprint_txt)
+    reader = SHMReader(data_struct, total_len, round_reals)
+    reader.attach(_attach_untracked(shm_name))
+    return reader
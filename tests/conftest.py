@@ -0,0 +1,98 @@
+import uuid
+
+import pytest
+import snap7
+
+from snap7_db_sync import Snap7DBSync
+
+# Every supported type, with bools split around the other types so bit packing and word alignment are exercised
+BLUEPRINT = """DATA_BLOCK "DB_test"
+STRUCT
+  a : Bool;
+  b : Bool;
+  c : Byte;
+  d : Int;
+  e : Word;
+  f : DInt;
+  g : DWord;
+  h : Real;
+  i : Time;
+  j : Bool;
+  k : Int;
+END_STRUCT;
+"""
+
+
+class FakeClient:
+    """
+    In-memory stand-in for snap7.client.Client: one bytearray per DB number, shared by every client instance.
+    Every db_read/db_write is logged; db_write raises `refuse` when it is set.
+    """
+    memory = {}
+    log = []
+    refuse = None
+
+    def connect(self, ip_addr, rack, slot):
+        pass
+
+    def get_connected(self):
+        return True
+
+    def disconnect(self):
+        pass
+
+    def destroy(self):
+        pass
+
+    def db_read(self, db_num, start, size):
+        FakeClient.log.append(('r', db_num, start, size))
+        mem = FakeClient.memory.setdefault(db_num, bytearray(1024))
+        return bytearray(mem[start:start + size])
+
+    def db_write(self, db_num, start, data):
+        FakeClient.log.append(('w', db_num, start, len(data)))
+        if FakeClient.refuse is not None:
+            raise FakeClient.refuse
+        mem = FakeClient.memory.setdefault(db_num, bytearray(1024))
+        mem[start:start + len(data)] = data
+
+
+@pytest.fixture
+def fake_plc(monkeypatch):
+    """
+    Replaces the snap7 client by FakeClient, with an empty PLC memory.
+    """
+    FakeClient.memory = {}
+    FakeClient.log = []
+    FakeClient.refuse = None
+    monkeypatch.setattr(snap7.client, 'Client', FakeClient)
+    return FakeClient
+
+
+@pytest.fixture
+def blueprint(tmp_path):
+    """
+    Path of a blueprint file holding BLUEPRINT.
+    """
+    path = tmp_path / 'db_blueprint.txt'
+    path.write_text(BLUEPRINT)
+    return str(path)
+
+
+@pytest.fixture
+def make_sync(fake_plc, blueprint):
+    """
+    Factory of connected Snap7DBSync instances on the fake PLC, each with its own Shared Memory segment.
+    Every instance is closed at teardown.
+    """
+    created = []
+
+    def make(db_num=7, db_bluprint_txt=blueprint):
+        sync = Snap7DBSync('127.0.0.1', db_num, db_bluprint_txt, shm_name=f'snap7_test_{uuid.uuid4().hex[:12]}')
+        assert sync.connect()
+        created.append(sync)
+        return sync
+
+    yield make
+    for sync in created:
+        sync.close_connection()
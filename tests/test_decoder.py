@@ -0,0 +1,94 @@
+import math
+import random
+import struct
+from pathlib import Path
+
+import pytest
+
+import snap7_db_sync.shm_reader as shm_reader
+from snap7_db_sync import Snap7DBSync, SHMReader
+
+EXAMPLES = Path(__file__).resolve().parent.parent / 'examples'
+
+
+@pytest.fixture(params=['numpy', 'struct'])
+def decode_backend(request, monkeypatch):
+    """
+    Builds readers with the NumPy structured dtype decoder, then with the whole-record Struct fallback.
+    """
+    if request.param == 'numpy':
+        if shm_reader.np is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(shm_reader, 'np', None)
+    return request.param
+
+
+@pytest.fixture
+def blueprints(blueprint, tmp_path):
+    """
+    Test and example blueprints, plus a bool heavy one (vectorized bools with NumPy) and one of many Reals.
+    """
+    lines = []
+    for i in range(100):
+        lines.append(f'  b{i} : Bool;\n')
+        if i % 7 == 3:
+            lines.append(f'  x{i} : Real;\n')
+        if i % 11 == 5:
+            lines.append(f'  y{i} : Byte;\n')
+    bools = tmp_path / 'bools.txt'
+    bools.write_text('STRUCT\n' + ''.join(lines) + 'END_STRUCT\n')
+    reals = tmp_path / 'reals.txt'
+    reals.write_text('STRUCT\n' + ''.join(f'  b{i} : Bool;\n  r{i} : Real;\n  k{i} : Int;\n' for i in range(40))
+                     + 'END_STRUCT\n')
+    return [
+        blueprint,
+        str(EXAMPLES / 'demo_db_blueprint1.txt'),
+        str(EXAMPLES / 'demo_db_blueprint2.txt'),
+        str(bools),
+        str(reals)
+    ]
+
+
+def _same(a, b) -> bool:
+    """
+    Equality of two decoded values, NaN Reals included.
+    """
+    if isinstance(a, float) and math.isnan(a):
+        return isinstance(b, float) and math.isnan(b)
+    return a == b and type(a) is type(b)
+
+
+def test_decoder_matches_extract_data(decode_backend, blueprints):
+    rng = random.Random(1)
+    for path in blueprints:
+        total_len, data = Snap7DBSync.parse_siemens_db(path)
+        reader = SHMReader(data, total_len)
+        flat = Snap7DBSync.flatten_tags(data)
+        for _ in range(50):
+            # Random images inside a larger buffer, decoded at a non-zero base as in the shared memory frame
+            buf = bytes(rng.getrandbits(8) for _ in range(total_len + 128))
+            ref = Snap7DBSync.extract_data(buf[64:64 + total_len], data)
+            decoded = reader._decode_all(memoryview(buf), 64)
+            assert list(decoded) == list(ref)
+            for name, value in ref.items():
+                assert _same(decoded[name], value), (path, name, decoded[name], value)
+                assert _same(reader._unpack_field(buf, name, 64), value), (path, name)
+            flat_values = Snap7DBSync.extract_data(buf[64:64 + total_len], flat)
+            assert all(_same(flat_values[name], value) for name, value in ref.items())
+
+
+def test_decoder_rounds_reals(decode_backend, blueprints):
+    rng = random.Random(3)
+    total_len, data = Snap7DBSync.parse_siemens_db(blueprints[-1])
+    reader = SHMReader(data, total_len, round_reals=4)
+    for _ in range(30):
+        image = bytearray(rng.getrandbits(8) for _ in range(total_len))
+        for meta in data.values():
+            if meta['type'] == 'real':
+                struct.pack_into('>f', image, meta['offset'], rng.uniform(-1000, 1000))
+        ref = Snap7DBSync.extract_data(bytes(image), data)
+        decoded = reader._decode_all(bytes(64) + bytes(image), 64)
+        for name, value in ref.items():
+            expected = round(value, 4) if data[name]['type'] == 'real' else value
+            assert decoded[name] == expected, (name, decoded[name], expected)
@@ -0,0 +1,153 @@
+import json
+import math
+import multiprocessing
+import struct
+import threading
+
+from snap7_db_sync import Snap7DBSync, attach_reader
+from snap7_db_sync.shm_reader import _FRAME_HEADER
+
+EXPECTED = {
+    'a': True, 'b': False, 'c': 200, 'd': -300, 'e': 60000, 'f': -70000,
+    'g': 4000000000, 'h': 1.5, 'i': 1234, 'j': True, 'k': 9
+}
+
+
+def _encode_expected(total_len: int) -> bytes:
+    """
+    Big-endian DB image of EXPECTED, encoded by hand at the offsets of the test blueprint.
+    """
+    image = bytearray(total_len)
+    image[0] = 0b01
+    image[1] = 200
+    struct.pack_into('>h', image, 2, -300)
+    struct.pack_into('>H', image, 4, 60000)
+    struct.pack_into('>i', image, 6, -70000)
+    struct.pack_into('>I', image, 10, 4000000000)
+    struct.pack_into('>f', image, 14, 1.5)
+    struct.pack_into('>i', image, 18, 1234)
+    image[22] = 0b01
+    struct.pack_into('>h', image, 24, 9)
+    return bytes(image)
+
+
+def test_parse_blueprint_offsets(blueprint):
+    total_len, data = Snap7DBSync.parse_siemens_db(blueprint)
+    assert total_len == 26
+    assert [(data[n]['offset'], data[n]['bit']) for n in 'abcdefghijk'] == [
+        (0, 0), (0, 1), (1, 0), (2, 0), (4, 0), (6, 0), (10, 0), (14, 0), (18, 0), (22, 0), (24, 0)
+    ]
+    assert data['h']['type'] == 'real'
+
+
+def test_publish_decode_round_trip(make_sync, blueprint):
+    sync = make_sync()
+    assert sync.read_all_variables() is None
+
+    sync._update_shared(_encode_expected(sync.total_len))
+    assert sync.read_all_variables() == EXPECTED
+    assert sync.get_many(['d', 'h']) == {'d': -300, 'h': 1.5}
+    assert sync.read_variable('g') == 4000000000
+
+    reader = attach_reader(sync.shm_name, blueprint)
+    try:
+        assert reader.read_all_variables() == EXPECTED
+        assert json.loads(reader.read_all_json()) == EXPECTED
+    finally:
+        reader.close()
+
+
+def test_read_all_json_non_finite_reals(make_sync):
+    sync = make_sync()
+    image = bytearray(_encode_expected(sync.total_len))
+    struct.pack_into('>f', image, 14, math.nan)
+    sync._update_shared(bytes(image))
+    assert json.loads(sync.read_all_json())['h'] is None
+    struct.pack_into('>f', image, 14, -math.inf)
+    sync._update_shared(bytes(image))
+    assert json.loads(sync.read_all_json())['h'] is None
+
+
+def test_read_frame_accepts_next_publication(make_sync):
+    # The writer fills the other slot, so a frame published during the decode does not invalidate it
+    sync = make_sync()
+    sync._update_shared(bytes([1]) * sync.total_len)
+    calls = []
+
+    def decode(mv, base):
+        calls.append(base)
+        if len(calls) == 1:
+            sync._update_shared(bytes([2]) * sync.total_len)
+        return bytes(mv[base:base + sync.total_len])
+
+    seq, payload = sync._reader._read_frame(decode)
+    assert len(calls) == 1
+    assert payload == bytes([1]) * sync.total_len
+    assert _FRAME_HEADER.unpack_from(sync._mv, 0)[0] == seq + 2
+
+
+def test_read_frame_retries_torn_slot(make_sync):
+    # Two publications during the decode refill the slot being decoded: the result is discarded and decoded again
+    sync = make_sync()
+    sync._update_shared(bytes([1]) * sync.total_len)
+    calls = []
+
+    def decode(mv, base):
+        calls.append(base)
+        if len(calls) == 1:
+            sync._update_shared(bytes([2]) * sync.total_len)
+            sync._update_shared(bytes([3]) * sync.total_len)
+        return bytes(mv[base:base + sync.total_len])
+
+    seq, payload = sync._reader._read_frame(decode)
+    assert len(calls) == 2
+    assert payload == bytes([3]) * sync.total_len
+    assert _FRAME_HEADER.unpack_from(sync._mv, 0)[0] == seq
+
+
+def _count_torn_frames(shm_name: str, db_bluprint_txt: str, reads: int, results) -> None:
+    """
+    Reader process of the stress test: counts the frames that are not made of one repeated byte.
+    """
+    reader = attach_reader(shm_name, db_bluprint_txt)
+    try:
+        torn = 0
+        for _ in range(reads):
+            frame = reader._read_frame(lambda mv, base: bytes(mv[base:base + reader.total_len]))
+            if frame is not None and len(set(frame[1])) != 1:
+                torn += 1
+        results.put(torn)
+    finally:
+        reader.close()
+
+
+def test_cross_process_reads_are_never_torn(make_sync, tmp_path):
+    # A 200 KB DB takes long enough to copy that an unguarded reader regularly sees a half written frame
+    big = tmp_path / 'big_blueprint.txt'
+    big.write_text("Static\n\tfirst\tByte\t0.0\n\tlast\tDInt\t199996.0\n")
+    sync = make_sync(db_bluprint_txt=str(big))
+    assert sync.total_len == 200000
+    sync._update_shared(bytes(sync.total_len))
+
+    stop = threading.Event()
+
+    def publish():
+        i = 0
+        while not stop.is_set():
+            i = (i + 1) % 256
+            sync._update_shared(bytes([i]) * sync.total_len)
+
+    writer = threading.Thread(target=publish)
+    writer.start()
+    ctx = multiprocessing.get_context('spawn')
+    results = ctx.Queue()
+    process = ctx.Process(target=_count_torn_frames, args=(sync.shm_name, str(big), 2000, results))
+    try:
+        process.start()
+        torn = results.get(timeout=120)
+        process.join(timeout=10)
+    finally:
+        stop.set()
+        writer.join()
+    assert torn == 0
+    assert process.exitcode == 0
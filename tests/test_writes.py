@@ -0,0 +1,201 @@
+import multiprocessing
+import time
+
+import pytest
+
+from snap7_db_sync import MultiDBReader, Snap7DBSync
+from snap7_db_sync.sync_engine import _WRITE_RETRIES
+
+
+def _wait_until(predicate, timeout: float = 3.0) -> bool:
+    """
+    Polls predicate until it is true or the timeout expires.
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def _plc_values(fake_plc, sync) -> dict:
+    """
+    Variables of the fake PLC DB of sync, decoded from its memory.
+    """
+    return Snap7DBSync.extract_data(bytes(fake_plc.memory[sync.db_num][:sync.total_len]), sync.data_struct)
+
+
+def _writes(fake_plc) -> list:
+    return [entry for entry in fake_plc.log if entry[0] == 'w']
+
+
+def test_direct_write_patches_only_changed_bytes(fake_plc, make_sync):
+    sync = make_sync()
+    assert sync.write_to_plc({'d': -5, 'a': True, 'h': 2.25})
+    values = _plc_values(fake_plc, sync)
+    assert (values['a'], values['d'], values['h']) == (True, -5, 2.25)
+
+    fake_plc.log.clear()
+    assert sync.write_to_plc({'j': True})
+    assert fake_plc.log == [('r', 7, 22, 1), ('w', 7, 22, 1)]
+    assert _plc_values(fake_plc, sync)['a'] is True
+
+
+def test_direct_write_rejects_invalid_value(fake_plc, make_sync):
+    sync = make_sync()
+    assert not sync.write_to_plc({'d': 'x'})
+    assert not sync.write_to_plc({'d': 40000})
+    assert not sync.write_to_plc({})
+    assert _writes(fake_plc) == []
+
+
+def test_queued_writes_merge_into_one_transaction(fake_plc, make_sync):
+    sync = make_sync()
+    sync.start_logging(5000)
+    assert _wait_until(lambda: sync.read_all_variables() is not None)
+    fake_plc.log.clear()
+    assert sync.write_to_plc({'d': 1}, flush=False)
+    assert sync.write_to_plc({'d': 2, 'e': 3}, flush=False)
+    assert not sync.write_to_plc({'k': 'x', 'f': 4}, flush=False)
+    assert _writes(fake_plc) == []
+
+    # stop_logging flushes the queue once, as a single transaction
+    sync.stop_logging()
+    assert _writes(fake_plc) == [('w', 7, 2, 8)]
+    values = _plc_values(fake_plc, sync)
+    assert (values['d'], values['e'], values['f'], values['k']) == (2, 3, 4, 0)
+
+
+def test_sync_write_served_by_logging_thread(fake_plc, make_sync):
+    sync = make_sync()
+    sync.start_logging(10)
+    try:
+        assert sync.write_to_plc({'k': 42, 'b': True})
+        assert _plc_values(fake_plc, sync)['k'] == 42
+        assert _wait_until(lambda: sync.get_many(['k', 'b']) == {'k': 42, 'b': True})
+    finally:
+        sync.stop_logging()
+
+
+def test_refused_queued_write_is_dropped(fake_plc, make_sync):
+    sync = make_sync()
+    sync.start_logging(10)
+    try:
+        fake_plc.refuse = RuntimeError("CPU : Item not available")
+        fake_plc.log.clear()
+        assert sync.write_to_plc({'k': 5}, flush=False)
+        assert _wait_until(lambda: len(_writes(fake_plc)) >= 1)
+        time.sleep(0.1)
+        assert len(_writes(fake_plc)) == 1
+        assert sync._pending_writes == {}
+    finally:
+        sync.stop_logging()
+
+
+def test_transient_write_error_retries_are_capped(fake_plc, make_sync):
+    sync = make_sync()
+    sync.start_logging(10)
+    try:
+        fake_plc.refuse = RuntimeError("TCP : Connection reset by peer")
+        fake_plc.log.clear()
+        assert sync.write_to_plc({'k': 5}, flush=False)
+        assert _wait_until(lambda: len(_writes(fake_plc)) >= 1 + _WRITE_RETRIES)
+        time.sleep(0.1)
+        assert len(_writes(fake_plc)) == 1 + _WRITE_RETRIES
+        assert sync._pending_writes == {}
+    finally:
+        sync.stop_logging()
+
+
+def test_transient_write_error_is_retried(fake_plc, make_sync):
+    sync = make_sync()
+    sync.start_logging(10)
+    try:
+        fake_plc.refuse = RuntimeError("TCP : Connection reset by peer")
+        assert sync.write_to_plc({'k': 5}, flush=False)
+        assert _wait_until(lambda: len(_writes(fake_plc)) >= 1)
+        fake_plc.refuse = None
+        assert _wait_until(lambda: _plc_values(fake_plc, sync)['k'] == 5)
+    finally:
+        sync.stop_logging()
+
+
+def test_stopped_queue_is_not_replayed(fake_plc, make_sync):
+    sync = make_sync()
+    sync.start_logging(10)
+    fake_plc.refuse = RuntimeError("TCP : Connection reset by peer")
+    assert sync.write_to_plc({'k': 7}, flush=False)
+    sync.stop_logging()
+    assert sync._pending_writes == {}
+
+    fake_plc.refuse = None
+    assert sync.write_to_plc({'k': 9})
+    sync.start_logging(10)
+    try:
+        assert _wait_until(lambda: sync.get('k') == 9)
+        time.sleep(0.05)
+        assert _plc_values(fake_plc, sync)['k'] == 9
+    finally:
+        sync.stop_logging()
+
+
+def test_stop_logging_cuts_long_cycle_short(make_sync):
+    sync = make_sync()
+    sync.start_logging(5000)
+    time.sleep(0.1)
+    start = time.perf_counter()
+    sync.stop_logging()
+    assert time.perf_counter() - start < 0.5
+    assert not sync.thread.is_alive()
+
+    other = make_sync(db_num=8)
+    reader = MultiDBReader('127.0.0.1')
+    assert reader.connect()
+    try:
+        assert reader.add(other)
+        other.start_logging()
+        reader.start_logging(5000)
+        time.sleep(0.1)
+        start = time.perf_counter()
+        reader.stop_logging()
+        assert time.perf_counter() - start < 0.5
+        assert not reader.thread.is_alive()
+    finally:
+        reader.close_connection()
+
+
+def test_multi_reader_reads_and_writes(fake_plc, make_sync):
+    first, second = make_sync(db_num=8), make_sync(db_num=9)
+    reader = MultiDBReader('127.0.0.1')
+    assert reader.connect()
+    try:
+        assert reader.add(first) and reader.add(second)
+        first.start_logging()
+        second.start_logging()
+        reader.start_logging(10)
+        assert first.write_to_plc({'c': 6})
+        assert second.write_to_plc({'c': 5}, flush=False)
+        assert _wait_until(lambda: first.get('c') == 6 and second.get('c') == 5)
+
+        # Stopping one instance leaves the other one logging
+        second.stop_logging()
+        assert first.write_to_plc({'c': 7})
+        assert _wait_until(lambda: first.get('c') == 7)
+        assert second.get('c') == 5
+    finally:
+        reader.close_connection()
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason="the fake PLC client only reaches the logging process when forked")
+def test_process_logging_writes(fake_plc, make_sync):
+    sync = make_sync()
+    assert sync.start_logging_in_process(10)
+    try:
+        assert sync.write_to_plc({'k': 11, 'a': True})
+        # The forked process has its own copy of the fake PLC: its write shows up in the frames it publishes
+        assert _wait_until(lambda: sync.get_many(['k', 'a']) == {'k': 11, 'a': True}, timeout=10.0)
+    finally:
+        sync.stop_logging()
+    assert sync.process is None